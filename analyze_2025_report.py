@@ -97,7 +97,10 @@ def load_all_2025_data():
     # FILTER TO 2025 DATA ONLY
     print(f"\nFiltering to 2025 data only...")
     print(f"  Before filter: {len(df):,} rows")
-    df = df[df['year'] == 2025].copy()
+    # Boolean indexing already returns a new frame, so skip the extra .copy()
+    # and leave out the free-text columns the report never reads
+    unused_cols = ['description', 'superset_id', 'exercise_notes']
+    df = df.loc[df['year'] == 2025, df.columns.difference(unused_cols, sort=False)]
     print(f"  After filter: {len(df):,} rows (2025 only)")
 
     # Assign time period for 2025
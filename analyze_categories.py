@@ -288,12 +288,8 @@ def analyze_intensity(df):
     
     return intensity_stats
 
-def main():
-    """Main function to run the category analysis."""
-    # Load data
-    file_path = 'data/June 16, 2025.csv'
-    df = load_data(file_path)
-    
+def run_analysis(df):
+    """Run the category analysis on a freshly loaded dataframe."""
     # Preprocess data
     df = preprocess_data(df)
     
@@ -305,9 +301,18 @@ def main():
     
     # Analyze intensity
     intensity_stats = analyze_intensity(df)
+    plt.close('all')
     
     print("\n=== Analysis Complete ===")
     print("Check the 'category_plots' directory for visualizations.")
 
+def main():
+    """Main function to run the category analysis."""
+    # Load data
+    file_path = 'data/June 16, 2025.csv'
+    df = load_data(file_path)
+    
+    run_analysis(df)
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
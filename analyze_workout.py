@@ -145,12 +145,8 @@ def visualize_data(df, exercise_counts, volume_stats):
     plt.savefig('plots/exercise_set_heatmap.png')
     print("Saved exercise set heatmap to plots/exercise_set_heatmap.png")
 
-def main():
-    """Main function to run the analysis."""
-    # Load data
-    file_path = 'data/June 16, 2025.csv'
-    df = load_data(file_path)
-    
+def run_analysis(df):
+    """Run the analysis on a freshly loaded dataframe."""
     # Explore and preprocess data
     df = basic_data_exploration(df)
     df = preprocess_data(df)
@@ -160,9 +156,18 @@ def main():
     
     # Visualize data
     visualize_data(df, exercise_counts, volume_stats)
+    plt.close('all')
     
     print("\n=== Analysis Complete ===")
     print("Check the 'plots' directory for visualizations.")
 
+def main():
+    """Main function to run the analysis."""
+    # Load data
+    file_path = 'data/June 16, 2025.csv'
+    df = load_data(file_path)
+    
+    run_analysis(df)
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
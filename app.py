@@ -1,54 +1,114 @@
 import os
+import hashlib
 import pandas as pd
 import numpy as np
 import json
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
 import analyze_workout
 import analyze_categories
 from analyze_categories import EXERCISE_CATEGORIES
 from datetime import datetime, timedelta
 
+# None of the endpoints mutate the loaded frames, so with copy-on-write the
+# preprocessed data stays shared between preforked gunicorn workers
+pd.options.mode.copy_on_write = True
+
 app = Flask(__name__)
 
 # Global variables to store data
 df = None
 category_df = None
+exercise_df = None
+big_three_data = None
+month_groups = None
+months_sorted = None
+
+# Big three lifts: (include pattern, exclude pattern) matched against exercise titles
+BIG_THREE_PATTERNS = {
+    'bench_press': ('Bench Press', 'Incline|Decline|Close'),
+    'squat': ('Squat', 'Bulgarian|Split'),
+    'deadlift': ('Deadlift', 'Romanian|Sumo'),
+}
+
+# ETag for all /api/* responses; the data never changes after startup
+DATA_ETAG = None
+
+# Endpoints whose responses also depend on today's date
+DATE_DEPENDENT_ENDPOINTS = {'get_goal_setting', 'get_monthly_summary'}
 
 def load_data():
     """Load and preprocess data for the application."""
-    global df, category_df
+    global df, category_df, exercise_df, big_three_data, month_groups, months_sorted, DATA_ETAG
     
     # Load data
     file_path = 'data/June 16, 2025.csv'
     df = analyze_workout.load_data(file_path)
     
+    # Tie the ETag to the CSV we loaded so a new export invalidates caches
+    mtime = os.path.getmtime(file_path)
+    DATA_ETAG = hashlib.md5(f'{file_path}:{mtime}'.encode()).hexdigest()
+    
     # Preprocess data
     df = analyze_workout.preprocess_data(df)
     
-    # Create a copy for category analysis
+    # Calculate volume
+    df['volume'] = df['weight_lbs'] * df['reps']
+    
+    # Extract month and year for time-based analysis. preprocess_data already
+    # parsed start_time with an explicit format, so use the .dt accessor directly
+    assert pd.api.types.is_datetime64_any_dtype(df['start_time'])
+    df['date'] = df['start_time'].dt.date
+    df['month'] = df['start_time'].dt.to_period('M')
+    df['year'] = df['start_time'].dt.year
+    
+    # Create a copy for category analysis, sharing the derived columns above
     category_df = df.copy()
     
-    # Add category to the dataframe
-    category_df['category'] = category_df['exercise_title'].apply(analyze_categories.categorize_exercise)
+    # Add category to the dataframe. Every known category is in the dtype, even
+    # with no sets, so slicing the sorted index by any of them is valid
+    category_dtype = pd.CategoricalDtype(sorted({*EXERCISE_CATEGORIES, 'Other'}))
+    category_df['category'] = category_df['exercise_title'].apply(analyze_categories.categorize_exercise).astype(category_dtype)
     
-    # Calculate volume
-    df['volume'] = df['weight_lbs'] * df['reps']
-    category_df['volume'] = category_df['weight_lbs'] * category_df['reps']
+    # Sorted lookup indexes so per-exercise and per-category filters are a
+    # binary search plus a contiguous slice instead of a full-column scan.
+    # Look them up with a label slice (.loc[x:x]); .loc[[x]] on a non-unique
+    # index scans every row.
+    # df itself keeps its original row order, which the set listings rely on.
+    exercise_df = df.sort_values('exercise_title', kind='mergesort').set_index('exercise_title', drop=False).rename_axis(None)
+    category_df = category_df.sort_values('category', kind='mergesort').set_index('category', drop=False).rename_axis(None)
     
-    # Extract month and year for time-based analysis
-    df['date'] = pd.to_datetime(df['start_time']).dt.date
-    df['month'] = pd.to_datetime(df['start_time']).dt.to_period('M')
-    df['year'] = pd.to_datetime(df['start_time']).dt.year
+    big_three_data = select_big_three(df)
     
-    category_df['date'] = pd.to_datetime(category_df['start_time']).dt.date
-    category_df['month'] = pd.to_datetime(category_df['start_time']).dt.to_period('M')
-    category_df['year'] = pd.to_datetime(category_df['start_time']).dt.year
+    # Per-month frames keyed by 'YYYY-MM' so month lookups are a dict get
+    month_groups = {str(month): group for month, group in df.groupby('month', sort=False)}
+    months_sorted = sorted(month_groups)
     
     return df, category_df
 
+def select_big_three(df):
+    """Split out the big three lifts, running the title regexes once per unique title."""
+    codes, titles = pd.factorize(df['exercise_title'])
+    titles = pd.Index(titles)
+    
+    result = {}
+    for lift, (include, exclude) in BIG_THREE_PATTERNS.items():
+        title_mask = (titles.str.contains(include, case=False, na=False) &
+                      ~titles.str.contains(exclude, case=False, na=False))
+        result[lift] = df[np.isin(codes, np.flatnonzero(title_mask))]
+    return result
+
+def count_values(column):
+    """Count values with np.bincount, most frequent first, as (value, count) pairs."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes = column.cat.codes.to_numpy()
+        values = column.cat.categories.to_numpy()
+    else:
+        codes, values = pd.factorize(column)
+    counts = np.bincount(codes[codes >= 0], minlength=len(values))
+    order = np.argsort(-counts, kind='stable')
+    order = order[counts[order] > 0]
+    return list(zip(values[order].tolist(), counts[order].tolist()))
+
 def calculate_one_rep_max(weight, reps):
     """Calculate 1RM using Epley formula: 1RM = weight * (1 + reps/30)"""
     if reps == 0 or weight == 0:
@@ -67,6 +127,45 @@ def calculate_brzycki_1rm(weight, reps):
         return weight * (1 + reps / 30)
     return weight / (1.0278 - 0.0278 * reps)
 
+def request_etag():
+    """Return the ETag for the current API request, or None if it isn't cached."""
+    if not DATA_ETAG or request.url_rule is None or not request.path.startswith('/api/'):
+        return None
+    
+    # The monthly summary only depends on the date when no month is requested
+    if request.endpoint in DATE_DEPENDENT_ENDPOINTS and not request.args.get('month'):
+        today = datetime.now().strftime('%Y-%m-%d')
+        return hashlib.md5(f'{DATA_ETAG}:{today}'.encode()).hexdigest()
+    return DATA_ETAG
+
+@app.before_request
+def check_etag():
+    """Answer conditional API requests with 304 when the client copy is current."""
+    # Routes with arguments can 404 (unknown exercise or category), so those
+    # are only answered with 304 once the view has run
+    if request.view_args:
+        return None
+    
+    etag = request_etag()
+    if etag and request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+
+@app.after_request
+def add_cache_headers(response):
+    """Add ETag and Cache-Control headers to successful API responses."""
+    etag = request_etag()
+    if etag and response.status_code == 200:
+        response.set_etag(etag)
+        # Date-dependent responses are revalidated so they don't go stale overnight
+        if etag == DATA_ETAG:
+            response.headers['Cache-Control'] = 'public, max-age=3600'
+        else:
+            response.headers['Cache-Control'] = 'no-cache'
+        response.make_conditional(request)
+    return response
+
 @app.route('/')
 def index():
     """Render the main dashboard page."""
@@ -79,26 +178,17 @@ def get_summary():
     total_sets = len(df)
     total_volume = df['volume'].sum()
     
-    # Calculate average weight, reps, and volume per exercise
-    exercise_stats = df.groupby('exercise_title').agg({
-        'weight_lbs': ['mean', 'max'],
-        'reps': ['mean', 'max'],
-        'volume': ['sum']
-    }).reset_index()
-    
     # Get top exercises by volume
     top_exercises = df.groupby('exercise_title')['volume'].sum().sort_values(ascending=False).head(10)
     top_exercises_list = [{"exercise": ex, "volume": vol} for ex, vol in top_exercises.items()]
     
     # Get category distribution
-    category_counts = category_df['category'].value_counts()
-    category_data = [{"category": cat, "count": count} for cat, count in category_counts.items()]
+    category_data = [{"category": cat, "count": count} for cat, count in count_values(category_df['category'])]
     
     # Get volume by category
-    category_volume = category_df.groupby('category')['volume'].sum().reset_index()
+    category_volume = category_df.groupby('category', observed=True)['volume'].sum().reset_index()
     category_volume = category_volume.sort_values('volume', ascending=False)
-    category_volume_data = [{"category": row['category'], "volume": row['volume']} 
-                           for _, row in category_volume.iterrows()]
+    category_volume_data = category_volume.to_dict('records')
     
     return jsonify({
         "total_exercises": total_exercises,
@@ -117,19 +207,16 @@ def get_monthly_summary():
     
     if requested_month:
         # Use the requested month
-        month_data = df[df['month'].astype(str) == requested_month]
+        month_data = month_groups.get(requested_month, df.iloc[0:0])
     else:
         # Get current month data
         current_month = datetime.now().strftime('%Y-%m')
-        month_data = df[df['month'].astype(str).str.startswith(current_month)]
+        month_data = month_groups.get(current_month)
         
-        if month_data.empty:
+        if month_data is None:
             # If no data for current month, use the most recent month with data
-            most_recent_month = df['month'].max()
-            month_data = df[df['month'] == most_recent_month]
-            current_month = str(most_recent_month)
-        else:
-            current_month = current_month
+            current_month = months_sorted[-1]
+            month_data = month_groups[current_month]
     
     # If still empty (could happen with requested_month), return empty data
     if month_data.empty:
@@ -143,37 +230,14 @@ def get_monthly_summary():
         })
     
     # Calculate workout duration for the month
-    workout_durations = 0
-    
-    # Debug information
-    print(f"\n===== DEBUG: MONTHLY DURATION CALCULATION =====")
-    
     # Group by both title AND date to identify unique workout sessions
     unique_workouts = month_data.groupby(['title', 'date']).agg({
         'start_time': 'min',
         'end_time': 'max'
-    }).reset_index()
-    
-    print(f"Found {len(unique_workouts)} unique workout sessions for this month")
-    
-    for _, workout in unique_workouts.iterrows():
-        try:
-            # Make sure we're dealing with datetime objects
-            start_time = pd.to_datetime(workout['start_time'])
-            end_time = pd.to_datetime(workout['end_time'])
-            
-            # Calculate duration in minutes
-            duration_minutes = (end_time - start_time).total_seconds() / 60
-            
-            workout_durations += duration_minutes
-            print(f"Workout: {workout['title']} on {workout['date']}")
-            print(f"  Start: {start_time}, End: {end_time}")
-            print(f"  Duration: {duration_minutes/60:.2f} hours")
-        except Exception as e:
-            print(f"Error processing workout {workout['title']}: {str(e)}")
+    })
     
-    print(f"Total duration for month: {workout_durations/60:.2f} hours")
-    print(f"===============================================\n")
+    # start_time/end_time are already datetime64, so subtract the columns directly
+    workout_durations = ((unique_workouts['end_time'] - unique_workouts['start_time']).dt.total_seconds() / 60).sum()
     
     # Calculate monthly stats
     monthly_workouts = month_data['title'].nunique()
@@ -193,100 +257,35 @@ def get_monthly_summary():
         "top_exercises": monthly_top_exercises_list
     })
 
+def period_summary(df, sessions, period):
+    """Summarize workouts, volume, sets and duration per month or year."""
+    period_data = df.groupby(period).agg(
+        workouts=('title', 'nunique'),
+        volume=('volume', 'sum'),
+        sets=('set_index', 'count')
+    )
+    period_data['duration_minutes'] = sessions.groupby(level=period)['duration_minutes'].sum()
+    period_data = period_data.fillna({'duration_minutes': 0})
+    
+    # Build the records in one call instead of a Series per row
+    keys = period_data.index.astype(str) if period == 'month' else period_data.index
+    period_data.insert(0, period, keys)
+    return period_data.to_dict('records')
+
 @app.route('/api/time_analysis')
 def get_time_analysis():
     """Get time-based analysis data (monthly and yearly)."""
-    # Monthly analysis
-    monthly_data = df.groupby('month').agg({
-        'title': 'nunique',
-        'volume': 'sum',
-        'set_index': 'count',
-    }).reset_index()
-    
-    # Calculate workout duration by month - using the corrected approach
-    monthly_durations = []
-    for month in monthly_data['month']:
-        month_df = df[df['month'] == month]
-        
-        # Group by both title AND date to identify unique workout sessions
-        unique_workouts = month_df.groupby(['title', 'date']).agg({
-            'start_time': 'min',
-            'end_time': 'max'
-        }).reset_index()
-        
-        month_duration = 0
-        for _, workout in unique_workouts.iterrows():
-            start_time = pd.to_datetime(workout['start_time'])
-            end_time = pd.to_datetime(workout['end_time'])
-            duration_minutes = (end_time - start_time).total_seconds() / 60
-            month_duration += duration_minutes
-        
-        monthly_durations.append({
-            'month': month,
-            'duration_minutes': month_duration
-        })
-    
-    monthly_duration_df = pd.DataFrame(monthly_durations)
-    
-    # Merge duration data
-    monthly_data = monthly_data.merge(monthly_duration_df, on='month', how='left')
-    
-    # Convert to list of dictionaries for JSON
-    monthly_result = []
-    for _, row in monthly_data.iterrows():
-        monthly_result.append({
-            "month": str(row['month']),
-            "workouts": int(row['title']),
-            "volume": float(row['volume']),
-            "sets": int(row['set_index']),
-            "duration_minutes": float(row['duration_minutes']) if not pd.isna(row['duration_minutes']) else 0
-        })
-    
-    # Yearly analysis
-    yearly_data = df.groupby('year').agg({
-        'title': 'nunique',
-        'volume': 'sum',
-        'set_index': 'count',
-    }).reset_index()
-    
-    # Calculate workout duration by year - using the corrected approach
-    yearly_durations = []
-    for year in yearly_data['year']:
-        year_df = df[df['year'] == year]
-        
-        # Group by both title AND date to identify unique workout sessions
-        unique_workouts = year_df.groupby(['title', 'date']).agg({
-            'start_time': 'min',
-            'end_time': 'max'
-        }).reset_index()
-        
-        year_duration = 0
-        for _, workout in unique_workouts.iterrows():
-            start_time = pd.to_datetime(workout['start_time'])
-            end_time = pd.to_datetime(workout['end_time'])
-            duration_minutes = (end_time - start_time).total_seconds() / 60
-            year_duration += duration_minutes
-        
-        yearly_durations.append({
-            'year': year,
-            'duration_minutes': year_duration
-        })
-    
-    yearly_duration_df = pd.DataFrame(yearly_durations)
-    
-    # Merge duration data
-    yearly_data = yearly_data.merge(yearly_duration_df, on='year', how='left')
-    
-    # Convert to list of dictionaries for JSON
-    yearly_result = []
-    for _, row in yearly_data.iterrows():
-        yearly_result.append({
-            "year": int(row['year']),
-            "workouts": int(row['title']),
-            "volume": float(row['volume']),
-            "sets": int(row['set_index']),
-            "duration_minutes": float(row['duration_minutes']) if not pd.isna(row['duration_minutes']) else 0
-        })
+    # Calculate workout duration in one pass: group by both title AND date to
+    # identify unique workout sessions, then roll the sessions up by month and year
+    sessions = df.groupby(['month', 'year', 'title', 'date']).agg(
+        start_time=('start_time', 'min'),
+        end_time=('end_time', 'max')
+    )
+    sessions['duration_minutes'] = (sessions['end_time'] - sessions['start_time']).dt.total_seconds() / 60
+    
+    # Monthly and yearly analysis
+    monthly_result = period_summary(df, sessions, 'month')
+    yearly_result = period_summary(df, sessions, 'year')
     
     return jsonify({
         "monthly": monthly_result,
@@ -296,15 +295,10 @@ def get_time_analysis():
 @app.route('/api/big_three_analysis')
 def get_big_three_analysis():
     """Get analysis data for the big three lifts (bench press, squat, deadlift)."""
-    # Define the big three exercises with more flexible matching
-    bench_press_data = df[df['exercise_title'].str.contains('Bench Press', case=False, na=False) & 
-                         ~df['exercise_title'].str.contains('Incline|Decline|Close', case=False, na=False)]
-    
-    squat_data = df[df['exercise_title'].str.contains('Squat', case=False, na=False) & 
-                   ~df['exercise_title'].str.contains('Bulgarian|Split', case=False, na=False)]
-    
-    deadlift_data = df[df['exercise_title'].str.contains('Deadlift', case=False, na=False) & 
-                      ~df['exercise_title'].str.contains('Romanian|Sumo', case=False, na=False)]
+    # Big three frames are selected once at load time
+    bench_press_data = big_three_data['bench_press']
+    squat_data = big_three_data['squat']
+    deadlift_data = big_three_data['deadlift']
     
     # Print debug information
     print(f"Found {len(bench_press_data)} bench press records")
@@ -326,23 +320,17 @@ def get_big_three_analysis():
         }
         
         # Calculate progress over time
-        bench_progress_df = bench_press_data.groupby('date').agg({
-            'weight_lbs': ['mean', 'max'],
-            'reps': ['mean', 'max'],
-            'volume': 'sum'
-        })
-        
-        # Convert to list of dictionaries
-        bench_progress_list = []
-        for date_idx, row in bench_progress_df.iterrows():
-            bench_progress_list.append({
-                "date": date_idx.strftime('%Y-%m-%d'),
-                "avg_weight": float(row[('weight_lbs', 'mean')]),
-                "max_weight": float(row[('weight_lbs', 'max')]),
-                "avg_reps": float(row[('reps', 'mean')]),
-                "max_reps": float(row[('reps', 'max')]),
-                "volume": float(row[('volume', 'sum')])
-            })
+        bench_progress_df = bench_press_data.groupby('date', sort=True).agg(
+            avg_weight=('weight_lbs', 'mean'),
+            max_weight=('weight_lbs', 'max'),
+            avg_reps=('reps', 'mean'),
+            max_reps=('reps', 'max'),
+            volume=('volume', 'sum')
+        ).astype(float)
+        
+        # Format all dates in one pass and convert to list of dictionaries
+        bench_progress_df.insert(0, 'date', pd.DatetimeIndex(bench_progress_df.index).strftime('%Y-%m-%d'))
+        bench_progress_list = bench_progress_df.reset_index(drop=True).to_dict('records')
     else:
         bench_stats = {
             "sets": 0,
@@ -371,23 +359,17 @@ def get_big_three_analysis():
         }
         
         # Calculate progress over time
-        squat_progress_df = squat_data.groupby('date').agg({
-            'weight_lbs': ['mean', 'max'],
-            'reps': ['mean', 'max'],
-            'volume': 'sum'
-        })
-        
-        # Convert to list of dictionaries
-        squat_progress_list = []
-        for date_idx, row in squat_progress_df.iterrows():
-            squat_progress_list.append({
-                "date": date_idx.strftime('%Y-%m-%d'),
-                "avg_weight": float(row[('weight_lbs', 'mean')]),
-                "max_weight": float(row[('weight_lbs', 'max')]),
-                "avg_reps": float(row[('reps', 'mean')]),
-                "max_reps": float(row[('reps', 'max')]),
-                "volume": float(row[('volume', 'sum')])
-            })
+        squat_progress_df = squat_data.groupby('date', sort=True).agg(
+            avg_weight=('weight_lbs', 'mean'),
+            max_weight=('weight_lbs', 'max'),
+            avg_reps=('reps', 'mean'),
+            max_reps=('reps', 'max'),
+            volume=('volume', 'sum')
+        ).astype(float)
+        
+        # Format all dates in one pass and convert to list of dictionaries
+        squat_progress_df.insert(0, 'date', pd.DatetimeIndex(squat_progress_df.index).strftime('%Y-%m-%d'))
+        squat_progress_list = squat_progress_df.reset_index(drop=True).to_dict('records')
     else:
         squat_stats = {
             "sets": 0,
@@ -416,23 +398,17 @@ def get_big_three_analysis():
         }
         
         # Calculate progress over time
-        deadlift_progress_df = deadlift_data.groupby('date').agg({
-            'weight_lbs': ['mean', 'max'],
-            'reps': ['mean', 'max'],
-            'volume': 'sum'
-        })
-        
-        # Convert to list of dictionaries
-        deadlift_progress_list = []
-        for date_idx, row in deadlift_progress_df.iterrows():
-            deadlift_progress_list.append({
-                "date": date_idx.strftime('%Y-%m-%d'),
-                "avg_weight": float(row[('weight_lbs', 'mean')]),
-                "max_weight": float(row[('weight_lbs', 'max')]),
-                "avg_reps": float(row[('reps', 'mean')]),
-                "max_reps": float(row[('reps', 'max')]),
-                "volume": float(row[('volume', 'sum')])
-            })
+        deadlift_progress_df = deadlift_data.groupby('date', sort=True).agg(
+            avg_weight=('weight_lbs', 'mean'),
+            max_weight=('weight_lbs', 'max'),
+            avg_reps=('reps', 'mean'),
+            max_reps=('reps', 'max'),
+            volume=('volume', 'sum')
+        ).astype(float)
+        
+        # Format all dates in one pass and convert to list of dictionaries
+        deadlift_progress_df.insert(0, 'date', pd.DatetimeIndex(deadlift_progress_df.index).strftime('%Y-%m-%d'))
+        deadlift_progress_list = deadlift_progress_df.reset_index(drop=True).to_dict('records')
     else:
         deadlift_stats = {
             "sets": 0,
@@ -454,8 +430,7 @@ def get_big_three_analysis():
 @app.route('/api/exercise_frequency')
 def get_exercise_frequency():
     """Get exercise frequency data for visualization."""
-    exercise_counts = df['exercise_title'].value_counts().head(15)
-    data = [{"exercise": ex, "count": count} for ex, count in exercise_counts.items()]
+    data = [{"exercise": ex, "count": count} for ex, count in count_values(df['exercise_title'])[:15]]
     return jsonify(data)
 
 @app.route('/api/exercise_volume')
@@ -481,25 +456,21 @@ def get_reps_distribution():
 def get_category_analysis():
     """Get category analysis data for visualization."""
     # Category counts
-    category_counts = category_df['category'].value_counts()
-    category_count_data = [{"category": cat, "count": count} for cat, count in category_counts.items()]
+    category_count_data = [{"category": cat, "count": count} for cat, count in count_values(category_df['category'])]
     
     # Category volume
-    category_volume = category_df.groupby('category')['volume'].sum().reset_index()
+    category_volume = category_df.groupby('category', observed=True)['volume'].sum().reset_index()
     category_volume = category_volume.sort_values('volume', ascending=False)
-    category_volume_data = [{"category": row['category'], "volume": float(row['volume'])} 
-                           for _, row in category_volume.iterrows()]
+    category_volume_data = category_volume.to_dict('records')
     
     # Category weight and reps
-    category_weight = category_df.groupby('category')['weight_lbs'].mean().reset_index()
+    category_weight = category_df.groupby('category', observed=True)['weight_lbs'].mean().reset_index()
     category_weight = category_weight.sort_values('weight_lbs', ascending=False)
-    category_weight_data = [{"category": row['category'], "weight": float(row['weight_lbs'])} 
-                           for _, row in category_weight.iterrows()]
+    category_weight_data = category_weight.rename(columns={'weight_lbs': 'weight'}).to_dict('records')
     
-    category_reps = category_df.groupby('category')['reps'].mean().reset_index()
+    category_reps = category_df.groupby('category', observed=True)['reps'].mean().reset_index()
     category_reps = category_reps.sort_values('reps', ascending=False)
-    category_reps_data = [{"category": row['category'], "reps": float(row['reps'])} 
-                         for _, row in category_reps.iterrows()]
+    category_reps_data = category_reps.to_dict('records')
     
     return jsonify({
         "category_counts": category_count_data,
@@ -514,45 +485,29 @@ def get_category_exercises(category):
     if category not in EXERCISE_CATEGORIES and category != 'Other':
         return jsonify({"error": "Category not found"}), 404
     
-    category_exercises = category_df[category_df['category'] == category]
-    
+    category_exercises = category_df.loc[category:category]
     if category_exercises.empty:
         return jsonify([])
     
-    # Get top exercises by volume
-    exercise_volume = category_exercises.groupby('exercise_title')['volume'].sum().reset_index()
-    exercise_volume = exercise_volume.sort_values('volume', ascending=False).head(10)
-    
-    # Calculate stats for top exercises
-    top_exercises = exercise_volume['exercise_title'].tolist()
-    top_exercises_df = category_exercises[category_exercises['exercise_title'].isin(top_exercises)]
+    # One named aggregation gives flat columns named after the JSON fields
+    exercise_stats = category_exercises.groupby('exercise_title').agg(
+        volume=('volume', 'sum'),
+        avg_weight=('weight_lbs', 'mean'),
+        max_weight=('weight_lbs', 'max'),
+        avg_reps=('reps', 'mean'),
+        max_reps=('reps', 'max')
+    ).astype(float)
     
-    exercise_stats = top_exercises_df.groupby('exercise_title').agg({
-        'weight_lbs': ['mean', 'max'],
-        'reps': ['mean', 'max'],
-        'volume': ['mean', 'sum']
-    })
-    
-    # Convert to list of dictionaries for JSON
-    result = []
-    for exercise in exercise_volume['exercise_title']:
-        stats = exercise_stats.loc[exercise]
-        result.append({
-            "exercise": exercise,
-            "volume": float(stats['volume']['sum']),
-            "avg_weight": float(stats['weight_lbs']['mean']),
-            "max_weight": float(stats['weight_lbs']['max']),
-            "avg_reps": float(stats['reps']['mean']),
-            "max_reps": float(stats['reps']['max'])
-        })
+    # Get top exercises by volume
+    top_exercises = exercise_stats.sort_values('volume', ascending=False).head(10)
+    result = top_exercises.rename_axis('exercise').reset_index().to_dict('records')
     
     return jsonify(result)
 
 @app.route('/api/exercise_details/<exercise>')
 def get_exercise_details(exercise):
     """Get detailed information for a specific exercise."""
-    exercise_data = df[df['exercise_title'] == exercise]
-    
+    exercise_data = exercise_df.loc[exercise:exercise]
     if exercise_data.empty:
         return jsonify({"error": "Exercise not found"}), 404
     
@@ -584,12 +539,10 @@ def get_exercise_details(exercise):
 def get_workout_balance():
     """Get workout balance data for visualization."""
     # Calculate percentage of volume by category
-    total_volume = category_df['volume'].sum()
-    category_volume = category_df.groupby('category')['volume'].sum()
-    category_percentage = (category_volume / total_volume * 100)
+    category_volume = category_df.groupby('category', observed=True)['volume'].sum()
+    category_percentage = (category_volume / category_volume.sum() * 100).rename('percentage').reset_index()
     
-    data = [{"category": cat, "percentage": float(pct)} for cat, pct in category_percentage.items()]
-    return jsonify(data)
+    return jsonify(category_percentage.to_dict('records'))
 
 @app.route('/api/recent_workouts')
 def get_recent_workouts():
@@ -662,27 +615,25 @@ def get_recent_workouts():
                 total_reps = exercise_data['reps'].sum()
                 avg_weight = exercise_data['weight_lbs'].mean()
                 
-                # Get individual set details for this exercise
+                # Get individual set details for this exercise, reading plain
+                # tuples instead of building a Series for every row
+                max_weight = max_weights.get(exercise, 0)
+                set_rows = exercise_data[['reps', 'weight_lbs', 'exercise_notes', 'set_type']].itertuples(index=False, name=None)
                 set_details = []
-                for _, set_row in exercise_data.iterrows():
+                for reps, weight, notes, set_type in set_rows:
                     # Calculate if this is a PR (personal record)
-                    is_pr = False
-                    if (set_row['set_type'] == 'normal' and 
-                        set_row['weight_lbs'] == max_weights.get(exercise, 0) and
-                        max_weights.get(exercise, 0) > 0):
-                        is_pr = True
+                    is_pr = set_type == 'normal' and weight == max_weight and max_weight > 0
                     
                     # Get notes if they exist
-                    notes = set_row.get('exercise_notes', '')
                     if pd.isna(notes):
                         notes = ''
                     
                     set_details.append({
-                        "reps": int(set_row['reps']),
-                        "weight": float(set_row['weight_lbs']) if not np.isnan(set_row['weight_lbs']) else 0,
+                        "reps": int(reps),
+                        "weight": float(weight) if not np.isnan(weight) else 0,
                         "notes": notes,
-                        "is_pr": is_pr,
-                        "set_type": set_row['set_type']
+                        "is_pr": bool(is_pr),
+                        "set_type": set_type
                     })
                 
                 exercise_details.append({
@@ -716,14 +667,10 @@ def get_workout_dates():
     if df is None:
         return jsonify({"error": "No data loaded"})
     
-    # Get unique workout days
-    workout_dates = df['date'].unique()
-    
-    # Sort dates in descending order
-    sorted_dates = sorted(workout_dates, reverse=True)
-    
-    # Format dates
-    formatted_dates = [date.strftime("%b %d, %Y") for date in sorted_dates]
+    # Get unique workout days from the datetime64 start times, then sort
+    # them in descending order and format them without a Python loop
+    workout_dates = pd.DatetimeIndex(df['start_time'].dt.normalize().unique())
+    formatted_dates = workout_dates.sort_values(ascending=False).strftime("%b %d, %Y").tolist()
     
     return jsonify({
         "dates": formatted_dates,
@@ -948,10 +895,11 @@ def get_goal_setting():
         "motivation_message": f"You're {year_progress:.1f}% through 2025 with {days_remaining} days left to achieve your 20% strength goals! Stay consistent and trust the process."
     })
 
+# Load data at import time so `gunicorn --preload` builds it once in the
+# master process instead of once per worker
+df, category_df = load_data()
+
 if __name__ == '__main__':
-    # Load data on startup
-    df, category_df = load_data()
-    
     # Only run the dev server when executed directly, not when run by gunicorn
     # Get port from environment variable or default to 8000
     port = int(os.environ.get('PORT', 8000))
@@ -5,92 +5,170 @@ Run whenever CSV data is updated.
 """
 
 import os
-import json
+import re
+import orjson
 import pandas as pd
 import numpy as np
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import analyze_workout
 import analyze_categories
 from analyze_categories import EXERCISE_CATEGORIES
 
+# Input CSV and the preprocessed frame cached from it. pyarrow is not a
+# dependency, so the cache is a pickle rather than feather/parquet
+DATA_FILE = 'data/Dec 3,2025.csv'
+CACHE_FILE = 'data/_cache.pkl'
+
 # Output directory
 OUTPUT_DIR = 'docs/data_json'
 
-def json_serialize(obj):
-    """Handle pandas/numpy/datetime types for JSON."""
-    if isinstance(obj, (pd.Timestamp, datetime)):
-        return obj.isoformat()
-    elif isinstance(obj, (np.integer, np.floating)):
-        return float(obj) if not np.isnan(obj) else None
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, pd.Period):
-        return str(obj)
-    elif pd.isna(obj):
-        return None
-    return obj
+# The dashboard JS is the only consumer, so write compact JSON unless DEBUG is 1, true or yes
+DEBUG = os.environ.get('DEBUG', '').lower() in ('1', 'true', 'yes')
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if DEBUG else 0)
 
-def load_workout_data():
+# Big three lifts: (key, include pattern, exclude pattern) matched against exercise titles
+BIG_THREE_LIFTS = [
+    ('bench_press', re.compile('Bench Press', re.IGNORECASE), re.compile('Incline|Decline|Close', re.IGNORECASE)),
+    ('squat', re.compile('Squat', re.IGNORECASE), re.compile('Bulgarian|Split', re.IGNORECASE)),
+    ('deadlift', re.compile('Deadlift', re.IGNORECASE), re.compile('Romanian|Sumo', re.IGNORECASE)),
+]
+
+# Exercise title characters rewritten for file name slugs in one translate
+# pass; dropping '(' and mapping ' ' to '_' also covers ' (' -> '_'
+SLUG_TABLE = str.maketrans({' ': '_', '/': '_', '-': '_', '(': None, ')': None,
+                            ',': None, "'": None, '"': None})
+
+# Write buffer for generated files, large enough that a streamed file reaches
+# the kernel in a handful of write() calls instead of one per 8 KiB
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+def open_output(output_path):
+    """Open a generated file for binary writing with a large buffer."""
+    return open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE)
+
+def write_json(data, output_path):
+    """Serialize data with orjson and write it to output_path.
+
+    Generators hand over only native types and NumPy values, which orjson
+    encodes itself, so no default= fallback is needed.
+    """
+    with open_output(output_path) as f:
+        f.write(orjson.dumps(data, option=JSON_OPTIONS))
+
+def write_records(frame, output_path):
+    """Write a flat DataFrame as a JSON array of records.
+
+    Goes through orjson rather than DataFrame.to_json, whose double_precision
+    tops out at 15 digits and so can't round-trip float64.
+    """
+    write_json(frame.to_dict('records'), output_path)
+
+# Workout frame held by each generator worker process, set by init_worker
+worker_df = None
+
+def init_worker(df):
+    """Keep the frame handed to a new worker process for every task it runs."""
+    global worker_df
+    worker_df = df
+
+def run_with_df(generator, *args):
+    """Call generator in a worker with that worker's frame as first argument."""
+    generator(worker_df, *args)
+
+def read_workout_data(file_path):
     """Load and preprocess workout data (from app.py)."""
-    file_path = 'data/Dec 3,2025.csv'
     df = analyze_workout.load_data(file_path)
 
     # Preprocess data
     df = analyze_workout.preprocess_data(df)
 
-    # Create a copy for category analysis
-    category_df = df.copy()
+    # Calculate volume and category on the single frame used by every generator
+    df['volume'] = df['weight_lbs'] * df['reps']
+    # Categorize each distinct title once and map the result onto the rows
+    category_map = {title: analyze_categories.categorize_exercise(title)
+                    for title in df['exercise_title'].unique()}
+    df['category'] = df['exercise_title'].map(category_map)
+
+    # Low-cardinality string keys are grouped and filtered repeatedly, so
+    # store them as categoricals and let pandas work on the integer codes
+    for column in ('exercise_title', 'title', 'set_type', 'category'):
+        df[column] = df[column].astype('category')
+
+    # Extract month and year for time-based analysis. start_time is already
+    # datetime64 (parsed once with an explicit format in preprocess_data)
+    start_time = df['start_time']
+    assert pd.api.types.is_datetime64_any_dtype(start_time)
+    df['date'] = start_time.dt.date
+    df['month'] = start_time.dt.to_period('M')
+    df['year'] = start_time.dt.year
+
+    # Rep counts are small whole numbers (missing reps are already filled
+    # with 0), so store them as int16. Weights and volume stay float64:
+    # float32 would leak rounding noise like 22.68 -> 22.6800003 into the JSON
+    df['reps'] = df['reps'].astype('int16')
+
+    return df
 
-    # Add category to the dataframe
-    category_df['category'] = category_df['exercise_title'].apply(analyze_categories.categorize_exercise)
+def load_workout_data():
+    """Load the preprocessed workout data, from the cache when it is fresh."""
+    # The cache is stale once the CSV or any of the loading code is newer
+    sources = [DATA_FILE, analyze_workout.__file__, analyze_categories.__file__, __file__]
+    if os.path.exists(CACHE_FILE) and os.path.getmtime(CACHE_FILE) > max(map(os.path.getmtime, sources)):
+        print(f"Loading cached data from {CACHE_FILE}...")
+        return pd.read_pickle(CACHE_FILE)
+
+    df = read_workout_data(DATA_FILE)
+
+    # Write to a temporary name first so an interrupted build never leaves a
+    # truncated cache behind
+    df.to_pickle(f'{CACHE_FILE}.tmp')
+    os.replace(f'{CACHE_FILE}.tmp', CACHE_FILE)
+    return df
+
+def exercise_frame(df, exercise_rows, exercise):
+    """Get the rows of one exercise from the precomputed partition."""
+    return df.take(exercise_rows.get(exercise, np.empty(0, dtype=np.intp)))
+
+def calculate_brzycki_1rm(weights, reps):
+    """Calculate 1RM using Brzycki formula: 1RM = weight / (1.0278 - 0.0278 * reps)
+
+    Vectorized over arrays of weights and reps. Uses Epley above 10 reps.
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    reps = np.asarray(reps, dtype=np.float64)
+    one_rm = np.where(reps > 10, weights * (1 + reps / 30), weights / (1.0278 - 0.0278 * reps))
+    one_rm = np.where(reps == 1, weights, one_rm)
+    return np.where((reps == 0) | (weights == 0), 0.0, one_rm)
+
+def workout_sessions(df):
+    """Get one row per workout session (title + date) with its duration in minutes."""
+    sessions = df.groupby(['month', 'year', 'title', 'date'], observed=True).agg(
+        start_time=('start_time', 'min'),
+        end_time=('end_time', 'max')
+    )
+    sessions['duration_minutes'] = (sessions['end_time'] - sessions['start_time']).dt.total_seconds() / 60
+    return sessions
 
-    # Calculate volume
-    df['volume'] = df['weight_lbs'] * df['reps']
-    category_df['volume'] = category_df['weight_lbs'] * category_df['reps']
-
-    # Extract month and year for time-based analysis
-    df['date'] = pd.to_datetime(df['start_time']).dt.date
-    df['month'] = pd.to_datetime(df['start_time']).dt.to_period('M')
-    df['year'] = pd.to_datetime(df['start_time']).dt.year
-
-    category_df['date'] = pd.to_datetime(category_df['start_time']).dt.date
-    category_df['month'] = pd.to_datetime(category_df['start_time']).dt.to_period('M')
-    category_df['year'] = pd.to_datetime(category_df['start_time']).dt.year
-
-    return df, category_df
-
-def calculate_brzycki_1rm(weight, reps):
-    """Calculate 1RM using Brzycki formula: 1RM = weight / (1.0278 - 0.0278 * reps)"""
-    if reps == 0 or weight == 0:
-        return 0
-    if reps == 1:
-        return weight
-    if reps > 10:
-        return weight * (1 + reps / 30)
-    return weight / (1.0278 - 0.0278 * reps)
-
-def generate_summary(df, category_df):
+def generate_summary(df, exercise_volume, category_counts, category_stats):
     """Generate summary.json - overall statistics."""
     print("  Generating summary.json...")
 
-    total_exercises = df['exercise_title'].nunique()
+    total_exercises = len(exercise_volume)
     total_sets = len(df)
     total_volume = df['volume'].sum()
 
     # Get top exercises by volume
-    top_exercises = df.groupby('exercise_title')['volume'].sum().sort_values(ascending=False).head(10)
+    top_exercises = exercise_volume.sort_values(ascending=False).head(10)
     top_exercises_list = [{"exercise": ex, "volume": float(vol)} for ex, vol in top_exercises.items()]
 
     # Get category distribution
-    category_counts = category_df['category'].value_counts()
     category_data = [{"category": cat, "count": int(count)} for cat, count in category_counts.items()]
 
     # Get volume by category
-    category_volume = category_df.groupby('category')['volume'].sum().reset_index()
-    category_volume = category_volume.sort_values('volume', ascending=False)
-    category_volume_data = [{"category": row['category'], "volume": float(row['volume'])}
-                           for _, row in category_volume.iterrows()]
+    category_volume = category_stats['volume'].sort_values(ascending=False)
+    category_volume_data = [{"category": cat, "volume": float(vol)} for cat, vol in category_volume.items()]
 
     data = {
         "total_exercises": int(total_exercises),
@@ -102,104 +180,34 @@ def generate_summary(df, category_df):
     }
 
     output_path = f'{OUTPUT_DIR}/summary.json'
-    with open(output_path, 'w') as f:
-        json.dump(data, f, default=json_serialize, indent=2)
+    write_json(data, output_path)
+
+def period_summary(df, sessions, period):
+    """Summarize workouts, volume, sets and duration per month or year."""
+    period_data = df.groupby(period).agg(
+        workouts=('title', 'nunique'),
+        volume=('volume', 'sum'),
+        sets=('set_index', 'count')
+    )
+    period_data['duration_minutes'] = sessions.groupby(level=period)['duration_minutes'].sum()
+    period_data = period_data.fillna({'duration_minutes': 0})
+
+    # Build the records in one call instead of a Series per row
+    keys = period_data.index.astype(str) if period == 'month' else period_data.index
+    period_data.insert(0, period, keys)
+    return period_data.to_dict('records')
 
 def generate_time_analysis(df):
     """Generate time_analysis.json - monthly and yearly trends."""
     print("  Generating time_analysis.json...")
 
-    # Monthly analysis
-    monthly_data = df.groupby('month').agg({
-        'title': 'nunique',
-        'volume': 'sum',
-        'set_index': 'count',
-    }).reset_index()
-
-    # Calculate workout duration by month
-    monthly_durations = []
-    for month in monthly_data['month']:
-        month_df = df[df['month'] == month]
-
-        # Group by both title AND date to identify unique workout sessions
-        unique_workouts = month_df.groupby(['title', 'date']).agg({
-            'start_time': 'min',
-            'end_time': 'max'
-        }).reset_index()
-
-        month_duration = 0
-        for _, workout in unique_workouts.iterrows():
-            start_time = pd.to_datetime(workout['start_time'])
-            end_time = pd.to_datetime(workout['end_time'])
-            duration_minutes = (end_time - start_time).total_seconds() / 60
-            month_duration += duration_minutes
-
-        monthly_durations.append({
-            'month': month,
-            'duration_minutes': month_duration
-        })
-
-    monthly_duration_df = pd.DataFrame(monthly_durations)
-
-    # Merge duration data
-    monthly_data = monthly_data.merge(monthly_duration_df, on='month', how='left')
+    # Calculate workout duration in one pass: group by both title AND date to
+    # identify unique workout sessions, then roll the sessions up by month and year
+    sessions = workout_sessions(df)
 
-    # Convert to list of dictionaries for JSON
-    monthly_result = []
-    for _, row in monthly_data.iterrows():
-        monthly_result.append({
-            "month": str(row['month']),
-            "workouts": int(row['title']),
-            "volume": float(row['volume']),
-            "sets": int(row['set_index']),
-            "duration_minutes": float(row['duration_minutes']) if not pd.isna(row['duration_minutes']) else 0
-        })
-
-    # Yearly analysis
-    yearly_data = df.groupby('year').agg({
-        'title': 'nunique',
-        'volume': 'sum',
-        'set_index': 'count',
-    }).reset_index()
-
-    # Calculate workout duration by year
-    yearly_durations = []
-    for year in yearly_data['year']:
-        year_df = df[df['year'] == year]
-
-        # Group by both title AND date to identify unique workout sessions
-        unique_workouts = year_df.groupby(['title', 'date']).agg({
-            'start_time': 'min',
-            'end_time': 'max'
-        }).reset_index()
-
-        year_duration = 0
-        for _, workout in unique_workouts.iterrows():
-            start_time = pd.to_datetime(workout['start_time'])
-            end_time = pd.to_datetime(workout['end_time'])
-            duration_minutes = (end_time - start_time).total_seconds() / 60
-            year_duration += duration_minutes
-
-        yearly_durations.append({
-            'year': year,
-            'duration_minutes': year_duration
-        })
-
-    yearly_duration_df = pd.DataFrame(yearly_durations)
-
-    # Merge duration data
-    yearly_data = yearly_data.merge(yearly_duration_df, on='year', how='left')
-
-    # Convert to list of dictionaries for JSON
-    yearly_result = []
-    for _, row in yearly_data.iterrows():
-        yearly_result.append({
-            "year": int(row['year']),
-            "workouts": int(row['title']),
-            "volume": float(row['volume']),
-            "sets": int(row['set_index']),
-            "duration_minutes": float(row['duration_minutes']) if not pd.isna(row['duration_minutes']) else 0
-        })
+    # Monthly and yearly analysis
+    monthly_result = period_summary(df, sessions, 'month')
+    yearly_result = period_summary(df, sessions, 'year')
 
     data = {
         "monthly": monthly_result,
@@ -207,55 +215,12 @@ def generate_time_analysis(df):
     }
 
     output_path = f'{OUTPUT_DIR}/time_analysis.json'
-    with open(output_path, 'w') as f:
-        json.dump(data, f, default=json_serialize, indent=2)
+    write_json(data, output_path)
 
-def generate_big_three_analysis(df):
-    """Generate big_three_analysis.json - bench, squat, deadlift data."""
-    print("  Generating big_three_analysis.json...")
-
-    # Define the big three exercises with flexible matching
-    bench_press_data = df[df['exercise_title'].str.contains('Bench Press', case=False, na=False) &
-                         ~df['exercise_title'].str.contains('Incline|Decline|Close', case=False, na=False)]
-
-    squat_data = df[df['exercise_title'].str.contains('Squat', case=False, na=False) &
-                   ~df['exercise_title'].str.contains('Bulgarian|Split', case=False, na=False)]
-
-    deadlift_data = df[df['exercise_title'].str.contains('Deadlift', case=False, na=False) &
-                      ~df['exercise_title'].str.contains('Romanian|Sumo', case=False, na=False)]
-
-    result = {}
-
-    # Process bench press data
-    if not bench_press_data.empty:
-        bench_stats = {
-            "sets": len(bench_press_data),
-            "avg_weight": float(bench_press_data['weight_lbs'].mean()),
-            "max_weight": float(bench_press_data['weight_lbs'].max()),
-            "avg_reps": float(bench_press_data['reps'].mean()),
-            "max_reps": float(bench_press_data['reps'].max()),
-            "total_volume": float(bench_press_data['volume'].sum())
-        }
-
-        # Calculate progress over time
-        bench_progress_df = bench_press_data.groupby('date').agg({
-            'weight_lbs': ['mean', 'max'],
-            'reps': ['mean', 'max'],
-            'volume': 'sum'
-        })
-
-        bench_progress_list = []
-        for date_idx, row in bench_progress_df.iterrows():
-            bench_progress_list.append({
-                "date": date_idx.strftime('%Y-%m-%d'),
-                "avg_weight": float(row[('weight_lbs', 'mean')]),
-                "max_weight": float(row[('weight_lbs', 'max')]),
-                "avg_reps": float(row[('reps', 'mean')]),
-                "max_reps": float(row[('reps', 'max')]),
-                "volume": float(row[('volume', 'sum')])
-            })
-    else:
-        bench_stats = {
+def analyze_lift(lift_data):
+    """Get stats and per-date progress for the sets of one big three lift."""
+    if lift_data.empty:
+        stats = {
             "sets": 0,
             "avg_weight": 0,
             "max_weight": 0,
@@ -263,169 +228,103 @@ def generate_big_three_analysis(df):
             "max_reps": 0,
             "total_volume": 0
         }
-        bench_progress_list = []
-
-    result['bench_press'] = {
-        "stats": bench_stats,
-        "progress": bench_progress_list
+        return {"stats": stats, "progress": []}
+
+    stats = {
+        "sets": len(lift_data),
+        "avg_weight": float(lift_data['weight_lbs'].mean()),
+        "max_weight": float(lift_data['weight_lbs'].max()),
+        "avg_reps": float(lift_data['reps'].mean()),
+        "max_reps": float(lift_data['reps'].max()),
+        "total_volume": float(lift_data['volume'].sum())
     }
 
-    # Process squat data
-    if not squat_data.empty:
-        squat_stats = {
-            "sets": len(squat_data),
-            "avg_weight": float(squat_data['weight_lbs'].mean()),
-            "max_weight": float(squat_data['weight_lbs'].max()),
-            "avg_reps": float(squat_data['reps'].mean()),
-            "max_reps": float(squat_data['reps'].max()),
-            "total_volume": float(squat_data['volume'].sum())
-        }
-
-        squat_progress_df = squat_data.groupby('date').agg({
-            'weight_lbs': ['mean', 'max'],
-            'reps': ['mean', 'max'],
-            'volume': 'sum'
-        })
-
-        squat_progress_list = []
-        for date_idx, row in squat_progress_df.iterrows():
-            squat_progress_list.append({
-                "date": date_idx.strftime('%Y-%m-%d'),
-                "avg_weight": float(row[('weight_lbs', 'mean')]),
-                "max_weight": float(row[('weight_lbs', 'max')]),
-                "avg_reps": float(row[('reps', 'mean')]),
-                "max_reps": float(row[('reps', 'max')]),
-                "volume": float(row[('volume', 'sum')])
-            })
-    else:
-        squat_stats = {
-            "sets": 0,
-            "avg_weight": 0,
-            "max_weight": 0,
-            "avg_reps": 0,
-            "max_reps": 0,
-            "total_volume": 0
-        }
-        squat_progress_list = []
-
-    result['squat'] = {
-        "stats": squat_stats,
-        "progress": squat_progress_list
-    }
+    # Calculate progress over time
+    progress_df = lift_data.groupby('date', sort=True).agg(
+        avg_weight=('weight_lbs', 'mean'),
+        max_weight=('weight_lbs', 'max'),
+        avg_reps=('reps', 'mean'),
+        max_reps=('reps', 'max'),
+        volume=('volume', 'sum')
+    ).astype(float)
+    progress_df.insert(0, 'date', pd.DatetimeIndex(progress_df.index).strftime('%Y-%m-%d'))
 
-    # Process deadlift data
-    if not deadlift_data.empty:
-        deadlift_stats = {
-            "sets": len(deadlift_data),
-            "avg_weight": float(deadlift_data['weight_lbs'].mean()),
-            "max_weight": float(deadlift_data['weight_lbs'].max()),
-            "avg_reps": float(deadlift_data['reps'].mean()),
-            "max_reps": float(deadlift_data['reps'].max()),
-            "total_volume": float(deadlift_data['volume'].sum())
-        }
+    return {"stats": stats, "progress": progress_df.reset_index(drop=True).to_dict('records')}
 
-        deadlift_progress_df = deadlift_data.groupby('date').agg({
-            'weight_lbs': ['mean', 'max'],
-            'reps': ['mean', 'max'],
-            'volume': 'sum'
-        })
+def generate_big_three_analysis(df):
+    """Generate big_three_analysis.json - bench, squat, deadlift data."""
+    print("  Generating big_three_analysis.json...")
 
-        deadlift_progress_list = []
-        for date_idx, row in deadlift_progress_df.iterrows():
-            deadlift_progress_list.append({
-                "date": date_idx.strftime('%Y-%m-%d'),
-                "avg_weight": float(row[('weight_lbs', 'mean')]),
-                "max_weight": float(row[('weight_lbs', 'max')]),
-                "avg_reps": float(row[('reps', 'mean')]),
-                "max_reps": float(row[('reps', 'max')]),
-                "volume": float(row[('volume', 'sum')])
-            })
-    else:
-        deadlift_stats = {
-            "sets": 0,
-            "avg_weight": 0,
-            "max_weight": 0,
-            "avg_reps": 0,
-            "max_reps": 0,
-            "total_volume": 0
-        }
-        deadlift_progress_list = []
+    # Run the patterns over the distinct titles only, then select each lift's
+    # rows with an integer membership test on the category codes
+    titles = df['exercise_title'].cat.categories
+    codes = df['exercise_title'].cat.codes.to_numpy()
 
-    result['deadlift'] = {
-        "stats": deadlift_stats,
-        "progress": deadlift_progress_list
-    }
+    result = {}
+    for key, include, exclude in BIG_THREE_LIFTS:
+        allowed = np.flatnonzero(titles.str.contains(include) & ~titles.str.contains(exclude))
+        result[key] = analyze_lift(df[np.isin(codes, allowed)])
 
     output_path = f'{OUTPUT_DIR}/big_three_analysis.json'
-    with open(output_path, 'w') as f:
-        json.dump(result, f, default=json_serialize, indent=2)
+    write_json(result, output_path)
 
-def generate_exercise_frequency(df):
+def generate_exercise_frequency(exercise_counts):
     """Generate exercise_frequency.json."""
     print("  Generating exercise_frequency.json...")
 
-    exercise_counts = df['exercise_title'].value_counts().head(15)
-    data = [{"exercise": ex, "count": int(count)} for ex, count in exercise_counts.items()]
+    data = exercise_counts.head(15).rename_axis('exercise').reset_index(name='count')
 
     output_path = f'{OUTPUT_DIR}/exercise_frequency.json'
-    with open(output_path, 'w') as f:
-        json.dump(data, f, default=json_serialize, indent=2)
+    write_records(data, output_path)
 
-def generate_exercise_volume(df):
+def generate_exercise_volume(exercise_volume):
     """Generate exercise_volume.json."""
     print("  Generating exercise_volume.json...")
 
-    exercise_volume = df.groupby('exercise_title')['volume'].sum().sort_values(ascending=False).head(15)
-    data = [{"exercise": ex, "volume": float(vol)} for ex, vol in exercise_volume.items()]
+    top_exercises = exercise_volume.sort_values(ascending=False).head(15)
+    data = top_exercises.rename_axis('exercise').reset_index(name='volume')
 
     output_path = f'{OUTPUT_DIR}/exercise_volume.json'
-    with open(output_path, 'w') as f:
-        json.dump(data, f, default=json_serialize, indent=2)
+    write_records(data, output_path)
 
 def generate_weight_distribution(df):
     """Generate weight_distribution.json."""
     print("  Generating weight_distribution.json...")
 
-    weights = df[df['weight_lbs'] > 0]['weight_lbs'].tolist()
+    # orjson serializes the array directly, no intermediate Python list
+    weights = df['weight_lbs'].to_numpy()
+    weights = weights[weights > 0]
 
     output_path = f'{OUTPUT_DIR}/weight_distribution.json'
-    with open(output_path, 'w') as f:
-        json.dump(weights, f, default=json_serialize, indent=2)
+    write_json(weights, output_path)
 
 def generate_reps_distribution(df):
     """Generate reps_distribution.json."""
     print("  Generating reps_distribution.json...")
 
-    reps = df[df['reps'] > 0]['reps'].tolist()
+    reps = df['reps'].to_numpy()
+    reps = reps[reps > 0]
 
     output_path = f'{OUTPUT_DIR}/reps_distribution.json'
-    with open(output_path, 'w') as f:
-        json.dump(reps, f, default=json_serialize, indent=2)
+    write_json(reps, output_path)
 
-def generate_category_analysis(category_df):
+def generate_category_analysis(category_counts, category_stats):
     """Generate category_analysis.json."""
     print("  Generating category_analysis.json...")
 
     # Category counts
-    category_counts = category_df['category'].value_counts()
     category_count_data = [{"category": cat, "count": int(count)} for cat, count in category_counts.items()]
 
     # Category volume
-    category_volume = category_df.groupby('category')['volume'].sum().reset_index()
-    category_volume = category_volume.sort_values('volume', ascending=False)
-    category_volume_data = [{"category": row['category'], "volume": float(row['volume'])}
-                           for _, row in category_volume.iterrows()]
+    category_volume = category_stats['volume'].sort_values(ascending=False)
+    category_volume_data = [{"category": cat, "volume": float(vol)} for cat, vol in category_volume.items()]
 
     # Category weight and reps
-    category_weight = category_df.groupby('category')['weight_lbs'].mean().reset_index()
-    category_weight = category_weight.sort_values('weight_lbs', ascending=False)
-    category_weight_data = [{"category": row['category'], "weight": float(row['weight_lbs'])}
-                           for _, row in category_weight.iterrows()]
+    category_weight = category_stats['weight_lbs'].sort_values(ascending=False)
+    category_weight_data = [{"category": cat, "weight": float(weight)} for cat, weight in category_weight.items()]
 
-    category_reps = category_df.groupby('category')['reps'].mean().reset_index()
-    category_reps = category_reps.sort_values('reps', ascending=False)
-    category_reps_data = [{"category": row['category'], "reps": float(row['reps'])}
-                         for _, row in category_reps.iterrows()]
+    category_reps = category_stats['reps'].sort_values(ascending=False)
+    category_reps_data = [{"category": cat, "reps": float(reps)} for cat, reps in category_reps.items()]
 
     data = {
         "category_counts": category_count_data,
@@ -435,36 +334,29 @@ def generate_category_analysis(category_df):
     }
 
     output_path = f'{OUTPUT_DIR}/category_analysis.json'
-    with open(output_path, 'w') as f:
-        json.dump(data, f, default=json_serialize, indent=2)
+    write_json(data, output_path)
 
-def generate_workout_balance(category_df):
+def generate_workout_balance(category_stats):
     """Generate workout_balance.json."""
     print("  Generating workout_balance.json...")
 
     # Calculate percentage of volume by category
-    total_volume = category_df['volume'].sum()
-    category_volume = category_df.groupby('category')['volume'].sum()
-    category_percentage = (category_volume / total_volume * 100)
+    category_volume = category_stats['volume']
+    category_percentage = (category_volume / category_volume.sum() * 100)
 
-    data = [{"category": cat, "percentage": float(pct)} for cat, pct in category_percentage.items()]
+    data = category_percentage.rename_axis('category').reset_index(name='percentage')
 
     output_path = f'{OUTPUT_DIR}/workout_balance.json'
-    with open(output_path, 'w') as f:
-        json.dump(data, f, default=json_serialize, indent=2)
+    write_records(data, output_path)
 
 def generate_workout_dates(df):
     """Generate workout_dates.json."""
     print("  Generating workout_dates.json...")
 
-    # Get unique workout days
-    workout_dates = df['date'].unique()
-
-    # Sort dates in descending order
-    sorted_dates = sorted(workout_dates, reverse=True)
-
-    # Format dates
-    formatted_dates = [date.strftime("%b %d, %Y") for date in sorted_dates]
+    # Get unique workout days from the datetime64 start times, then sort
+    # them in descending order and format them without a Python loop
+    workout_dates = pd.DatetimeIndex(df['start_time'].dt.normalize().unique())
+    formatted_dates = workout_dates.sort_values(ascending=False).strftime("%b %d, %Y").tolist()
 
     data = {
         "dates": formatted_dates,
@@ -472,10 +364,9 @@ def generate_workout_dates(df):
     }
 
     output_path = f'{OUTPUT_DIR}/workout_dates.json'
-    with open(output_path, 'w') as f:
-        json.dump(data, f, default=json_serialize, indent=2)
+    write_json(data, output_path)
 
-def generate_personal_records(df):
+def generate_personal_records(df, exercise_rows):
     """Generate personal_records.json with 1RM calculations."""
     print("  Generating personal_records.json...")
 
@@ -484,7 +375,7 @@ def generate_personal_records(df):
     pr_data = {}
 
     for lift in main_lifts:
-        lift_data = df[df['exercise_title'] == lift].copy()
+        lift_data = exercise_frame(df, exercise_rows, lift)
 
         if lift_data.empty:
             pr_data[lift] = {
@@ -503,15 +394,15 @@ def generate_personal_records(df):
         if normal_sets.empty:
             normal_sets = lift_data
 
-        normal_sets['estimated_1rm'] = normal_sets.apply(
-            lambda row: calculate_brzycki_1rm(row['weight_lbs'], row['reps']), axis=1
-        )
+        # Reduce over plain arrays: the best 1RM position also gives the best
+        # set and its 1RM, so no extra column, idxmax and max scans are needed
+        weights = normal_sets['weight_lbs'].to_numpy()
+        one_rms = calculate_brzycki_1rm(weights, normal_sets['reps'].to_numpy())
+        best_1rm_pos = np.nanargmax(one_rms)
+        best_set = normal_sets.iloc[best_1rm_pos]
 
-        best_1rm_idx = normal_sets['estimated_1rm'].idxmax()
-        best_set = normal_sets.loc[best_1rm_idx]
-
-        current_max_weight = normal_sets['weight_lbs'].max()
-        estimated_1rm = normal_sets['estimated_1rm'].max()
+        current_max_weight = np.nanmax(weights)
+        estimated_1rm = one_rms[best_1rm_pos]
 
         hypertrophy_weight = estimated_1rm * 0.65
         hypertrophy_weight_high = estimated_1rm * 0.80
@@ -529,7 +420,7 @@ def generate_personal_records(df):
                 "weight": float(best_set['weight_lbs']),
                 "reps": int(best_set['reps']),
                 "date": best_set['date'].strftime('%Y-%m-%d'),
-                "estimated_1rm": float(best_set['estimated_1rm'])
+                "estimated_1rm": float(estimated_1rm)
             },
             "total_sets": len(normal_sets),
             "hypertrophy_recommendation": {
@@ -585,10 +476,9 @@ def generate_personal_records(df):
     }
 
     output_path = f'{OUTPUT_DIR}/personal_records.json'
-    with open(output_path, 'w') as f:
-        json.dump(data, f, default=json_serialize, indent=2)
+    write_json(data, output_path)
 
-def generate_goal_setting(df):
+def generate_goal_setting(df, exercise_rows):
     """Generate goal_setting.json with 2025 goal tracking."""
     print("  Generating goal_setting.json...")
 
@@ -600,7 +490,7 @@ def generate_goal_setting(df):
     baseline_date = datetime(2025, 1, 1).date()
 
     for lift in main_lifts:
-        lift_data = df[df['exercise_title'] == lift].copy()
+        lift_data = exercise_frame(df, exercise_rows, lift)
 
         if lift_data.empty:
             goal_data[lift] = {
@@ -617,9 +507,9 @@ def generate_goal_setting(df):
         if normal_sets.empty:
             normal_sets = lift_data
 
-        normal_sets['estimated_1rm'] = normal_sets.apply(
-            lambda row: calculate_brzycki_1rm(row['weight_lbs'], row['reps']), axis=1
-        )
+        normal_sets = normal_sets.assign(estimated_1rm=calculate_brzycki_1rm(
+            normal_sets['weight_lbs'].to_numpy(), normal_sets['reps'].to_numpy()
+        ))
 
         # Get baseline 1RM (best performance around January 1, 2025)
         baseline_window_start = datetime(2024, 12, 1).date()
@@ -697,8 +587,7 @@ def generate_goal_setting(df):
     }
 
     output_path = f'{OUTPUT_DIR}/goal_setting.json'
-    with open(output_path, 'w') as f:
-        json.dump(data, f, default=json_serialize, indent=2)
+    write_json(data, output_path)
 
 def generate_monthly_summary(df):
     """Generate monthly_summary.json - array of all months."""
@@ -706,32 +595,14 @@ def generate_monthly_summary(df):
 
     all_months_data = []
 
-    # Get all unique months
-    unique_months = sorted(df['month'].unique())
-
-    for requested_month in unique_months:
-        month_data = df[df['month'] == requested_month]
-
-        if month_data.empty:
-            continue
+    # Workout durations for every month in one pass
+    monthly_durations = workout_sessions(df).groupby(level='month')['duration_minutes'].sum()
 
+    # Factorize the months once and walk the groups in order instead of
+    # re-masking the whole frame for each month
+    for requested_month, month_data in df.groupby('month', sort=True):
         # Calculate workout duration for the month
-        workout_durations = 0
-
-        # Group by both title AND date to identify unique workout sessions
-        unique_workouts = month_data.groupby(['title', 'date']).agg({
-            'start_time': 'min',
-            'end_time': 'max'
-        }).reset_index()
-
-        for _, workout in unique_workouts.iterrows():
-            try:
-                start_time = pd.to_datetime(workout['start_time'])
-                end_time = pd.to_datetime(workout['end_time'])
-                duration_minutes = (end_time - start_time).total_seconds() / 60
-                workout_durations += duration_minutes
-            except Exception:
-                pass
+        workout_durations = monthly_durations.get(requested_month, 0)
 
         # Calculate monthly stats
         monthly_workouts = month_data['title'].nunique()
@@ -739,7 +610,7 @@ def generate_monthly_summary(df):
         monthly_volume = float(month_data['volume'].sum())
 
         # Get top exercises for the month
-        monthly_top_exercises = month_data.groupby('exercise_title')['volume'].sum().sort_values(ascending=False).head(5)
+        monthly_top_exercises = month_data.groupby('exercise_title', observed=True)['volume'].sum().sort_values(ascending=False).head(5)
         monthly_top_exercises_list = [{"exercise": ex, "volume": float(vol)} for ex, vol in monthly_top_exercises.items()]
 
         all_months_data.append({
@@ -752,200 +623,162 @@ def generate_monthly_summary(df):
         })
 
     output_path = f'{OUTPUT_DIR}/monthly_summary.json'
-    with open(output_path, 'w') as f:
-        json.dump(all_months_data, f, default=json_serialize, indent=2)
+    write_json(all_months_data, output_path)
 
-def generate_category_exercises(category_df):
+def generate_category_exercises(df):
     """Generate category exercises JSON files - 7 files."""
     print("  Generating category exercise files...")
 
     categories = ['Chest', 'Back', 'Legs', 'Shoulders', 'Arms', 'Core', 'Other']
 
     for category in categories:
-        category_exercises = category_df[category_df['category'] == category]
+        category_exercises = df[df['category'] == category]
+
+        slug = category.lower()
+        output_path = f'{OUTPUT_DIR}/category_exercises_{slug}.json'
 
         if category_exercises.empty:
-            data = []
-        else:
-            # Get top exercises by volume
-            exercise_volume = category_exercises.groupby('exercise_title')['volume'].sum().reset_index()
-            exercise_volume = exercise_volume.sort_values('volume', ascending=False).head(10)
-
-            # Calculate stats for top exercises
-            top_exercises = exercise_volume['exercise_title'].tolist()
-            top_exercises_df = category_exercises[category_exercises['exercise_title'].isin(top_exercises)]
-
-            exercise_stats = top_exercises_df.groupby('exercise_title').agg({
-                'weight_lbs': ['mean', 'max'],
-                'reps': ['mean', 'max'],
-                'volume': ['mean', 'sum']
-            })
+            write_json([], output_path)
+            continue
 
-            # Convert to list of dictionaries for JSON
-            data = []
-            for exercise in exercise_volume['exercise_title']:
-                if exercise in exercise_stats.index:
-                    stats = exercise_stats.loc[exercise]
-                    data.append({
-                        "exercise": exercise,
-                        "volume": float(stats['volume']['sum']),
-                        "avg_weight": float(stats['weight_lbs']['mean']),
-                        "max_weight": float(stats['weight_lbs']['max']),
-                        "avg_reps": float(stats['reps']['mean']),
-                        "max_reps": float(stats['reps']['max'])
-                    })
+        # One named aggregation gives flat columns named after the JSON fields
+        exercise_stats = category_exercises.groupby('exercise_title', observed=True).agg(
+            volume=('volume', 'sum'),
+            avg_weight=('weight_lbs', 'mean'),
+            max_weight=('weight_lbs', 'max'),
+            avg_reps=('reps', 'mean'),
+            max_reps=('reps', 'max')
+        ).astype(float)
 
-        slug = category.lower()
-        output_path = f'{OUTPUT_DIR}/category_exercises_{slug}.json'
-        with open(output_path, 'w') as f:
-            json.dump(data, f, default=json_serialize, indent=2)
+        # Get top exercises by volume
+        top_exercises = exercise_stats.sort_values('volume', ascending=False).head(10)
+        write_records(top_exercises.rename_axis('exercise').reset_index(), output_path)
 
-def generate_exercise_details(df):
+def generate_exercise_details(df, exercise_rows):
     """Generate exercise details JSON files - one per exercise."""
     print("  Generating exercise detail files...")
+    print(f"    Processing {len(exercise_rows)} exercises...")
 
-    # Get unique exercises
-    unique_exercises = df['exercise_title'].unique()
-    print(f"    Processing {len(unique_exercises)} exercises...")
+    # Calculate stats for every exercise in one aggregation
+    stats_by_exercise = df.groupby('exercise_title', observed=True).agg(
+        sets=('volume', 'size'),
+        avg_weight=('weight_lbs', 'mean'),
+        max_weight=('weight_lbs', 'max'),
+        avg_reps=('reps', 'mean'),
+        max_reps=('reps', 'max'),
+        total_volume=('volume', 'sum')
+    ).astype(float).astype({'sets': int}).to_dict('index')
 
-    for exercise in unique_exercises:
-        exercise_data = df[df['exercise_title'] == exercise]
-
-        if exercise_data.empty:
-            continue
-
-        # Calculate stats
-        stats = {
-            "sets": len(exercise_data),
-            "avg_weight": float(exercise_data['weight_lbs'].mean()),
-            "max_weight": float(exercise_data['weight_lbs'].max()),
-            "avg_reps": float(exercise_data['reps'].mean()),
-            "max_reps": float(exercise_data['reps'].max()),
-            "total_volume": float(exercise_data['volume'].sum())
-        }
+    for exercise, rows in exercise_rows.items():
+        exercise_data = df.take(rows)
 
         # Get set data for visualization
-        set_data = exercise_data.sort_values('set_index')[['set_index', 'weight_lbs', 'reps', 'volume']].to_dict('records')
+        set_rows = exercise_data.sort_values('set_index')[['set_index', 'weight_lbs', 'reps', 'volume']].to_numpy()
         set_data_list = [{
-            "set": int(row['set_index']),
-            "weight": float(row['weight_lbs']),
-            "reps": float(row['reps']),
-            "volume": float(row['volume'])
-        } for row in set_data]
+            "set": int(set_index),
+            "weight": float(weight),
+            "reps": float(reps),
+            "volume": float(volume)
+        } for set_index, weight, reps, volume in set_rows]
 
         data = {
-            "stats": stats,
+            "stats": stats_by_exercise[exercise],
             "sets": set_data_list
         }
 
         # Create URL-safe slug
-        slug = exercise.lower() \
-            .replace(' (', '_') \
-            .replace('(', '') \
-            .replace(')', '') \
-            .replace(' ', '_') \
-            .replace('/', '_') \
-            .replace('-', '_') \
-            .replace(',', '') \
-            .replace("'", '') \
-            .replace('"', '')
+        slug = exercise.lower().translate(SLUG_TABLE)
 
         output_path = f'{OUTPUT_DIR}/exercise_{slug}.json'
-        with open(output_path, 'w') as f:
-            json.dump(data, f, default=json_serialize, indent=2)
-
-def generate_recent_workouts(df):
-    """Generate recent_workouts.json - full dataset."""
-    print("  Generating recent_workouts.json...")
-
-    # Get unique workout days (dates)
-    workout_dates = sorted(df['date'].unique(), reverse=True)
-
-    # Calculate the maximum weight for each exercise across the entire dataset
-    max_weights = {}
-    for exercise in df['exercise_title'].unique():
-        exercise_data = df[df['exercise_title'] == exercise]
-        normal_sets = exercise_data[exercise_data['set_type'] == 'normal']
-        if len(normal_sets) > 0:
-            max_weights[exercise] = normal_sets['weight_lbs'].max()
-        else:
-            max_weights[exercise] = 0
-
-    result = []
-    for date in workout_dates:
-        # Filter data for this date
-        day_data = df[df['date'] == date]
-
-        # Get unique workout names for this day
-        workouts = day_data['title'].unique()
-
-        # Get exercises for each workout
-        workout_details = []
-        for workout in workouts:
-            workout_exercises = day_data[day_data['title'] == workout]['exercise_title'].unique()
-
-            # Calculate total volume for this workout
-            workout_volume = day_data[day_data['title'] == workout]['volume'].sum()
-
-            # Get exercise details
-            exercise_details = []
-            for exercise in workout_exercises:
-                exercise_data = day_data[(day_data['title'] == workout) &
-                                       (day_data['exercise_title'] == exercise)]
-
-                sets = len(exercise_data)
-                total_reps = exercise_data['reps'].sum()
-                avg_weight = exercise_data['weight_lbs'].mean()
-
-                # Get individual set details for this exercise
-                set_details = []
-                for _, set_row in exercise_data.iterrows():
-                    # Calculate if this is a PR (personal record)
-                    is_pr = False
-                    if (set_row['set_type'] == 'normal' and
-                        set_row['weight_lbs'] == max_weights.get(exercise, 0) and
-                        max_weights.get(exercise, 0) > 0):
-                        is_pr = True
-
-                    # Get notes if they exist
-                    notes = set_row.get('exercise_notes', '')
-                    if pd.isna(notes):
-                        notes = ''
-
-                    set_details.append({
-                        "reps": int(set_row['reps']),
-                        "weight": float(set_row['weight_lbs']) if not np.isnan(set_row['weight_lbs']) else 0,
-                        "notes": notes,
-                        "is_pr": is_pr,
-                        "set_type": set_row['set_type']
-                    })
-
-                exercise_details.append({
-                    "name": exercise,
-                    "sets": sets,
-                    "total_reps": int(total_reps),
-                    "avg_weight": round(float(avg_weight), 1) if not np.isnan(avg_weight) else 0,
-                    "set_details": set_details
+        write_json(data, output_path)
+
+def recent_workout_day(day_data, date, exercise_stats):
+    """Build the recent_workouts.json entry for one workout day."""
+    # Split the day by workout, then by exercise, keeping first-seen order
+    workout_details = []
+    for workout, workout_data in day_data.groupby('title', sort=False, observed=True):
+        workout_exercises = workout_data.groupby('exercise_title', sort=False, observed=True)
+
+        # Calculate total volume for this workout
+        workout_volume = workout_data['volume'].sum()
+
+        # Get exercise details
+        exercise_details = []
+        for exercise, exercise_data in workout_exercises:
+            stats = exercise_stats[(date, workout, exercise)]
+            avg_weight = stats['avg_weight']
+
+            # Get individual set details for this exercise
+            set_rows = exercise_data[['reps', 'weight_lbs', 'exercise_notes', 'is_pr', 'set_type']].to_numpy()
+            set_details = []
+            for reps, weight, notes, set_is_pr, set_type in set_rows:
+                set_details.append({
+                    "reps": int(reps),
+                    "weight": float(weight) if not np.isnan(weight) else 0,
+                    "notes": notes,
+                    "is_pr": bool(set_is_pr),
+                    "set_type": set_type
                 })
 
-            workout_details.append({
-                "name": workout,
-                "exercise_count": len(workout_exercises),
-                "volume": float(workout_volume),
-                "exercises": exercise_details
+            exercise_details.append({
+                "name": exercise,
+                "sets": stats['sets'],
+                "total_reps": stats['total_reps'],
+                "avg_weight": round(float(avg_weight), 1) if not np.isnan(avg_weight) else 0,
+                "set_details": set_details
             })
 
-        # Format date as string
-        date_str = date.strftime("%b %d, %Y")
-
-        result.append({
-            "date": date_str,
-            "workouts": workout_details
+        workout_details.append({
+            "name": workout,
+            "exercise_count": workout_exercises.ngroups,
+            "volume": float(workout_volume),
+            "exercises": exercise_details
         })
 
+    # Format date as string
+    date_str = date.strftime("%b %d, %Y")
+
+    return {
+        "date": date_str,
+        "workouts": workout_details
+    }
+
+def generate_recent_workouts(df):
+    """Generate recent_workouts.json - full dataset."""
+    print("  Generating recent_workouts.json...")
+
+    # Flag personal records in one vectorized pass: a normal set at the
+    # heaviest normal-set weight for its exercise. The flags and cleaned notes
+    # go on a local frame so the df shared with other generators is untouched
+    is_normal = df['set_type'] == 'normal'
+    max_weights = df['weight_lbs'].where(is_normal).groupby(df['exercise_title'], observed=True).transform('max')
+    is_pr = is_normal & (df['weight_lbs'] == max_weights) & (max_weights > 0)
+    df = df.assign(is_pr=is_pr, exercise_notes=df['exercise_notes'].fillna(''))
+
+    # Row positions of every workout day, partitioned once. Its keys are the
+    # unique workout days, so no separate unique() pass is needed
+    day_rows = df.groupby('date', sort=False).indices
+    workout_dates = sorted(day_rows, reverse=True)
+
+    # Per-exercise summaries for every (day, workout, exercise) in one
+    # aggregation, looked up by key while the days are built
+    exercise_stats = df.groupby(['date', 'title', 'exercise_title'], sort=False, observed=True).agg(
+        sets=('reps', 'size'),
+        total_reps=('reps', 'sum'),
+        avg_weight=('weight_lbs', 'mean')
+    ).to_dict('index')
+
+    # Stream the array one day at a time so the full history is never held
+    # in memory twice (as Python objects and as encoded JSON)
     output_path = f'{OUTPUT_DIR}/recent_workouts.json'
-    with open(output_path, 'w') as f:
-        json.dump(result, f, default=json_serialize, indent=2)
+    with open_output(output_path) as f:
+        f.write(b'[')
+        for i, date in enumerate(workout_dates):
+            if i:
+                f.write(b',')
+            day_data = df.take(day_rows[date])
+            f.write(orjson.dumps(recent_workout_day(day_data, date, exercise_stats), option=JSON_OPTIONS))
+        f.write(b']')
 
 def copy_assets():
     """Copy static assets and convert HTML template."""
@@ -964,8 +797,6 @@ def copy_assets():
 
     # Replace Flask template syntax
     # Pattern 1: {{ url_for('static', filename='...') }} -> ./static/...
-    import re
-
     # Replace all instances of {{ url_for('static', filename='...') }}
     html_content = re.sub(
         r"{{\s*url_for\('static',\s*filename='([^']+)'\)\s*}}",
@@ -990,31 +821,52 @@ def main():
 
     # Load data
     print("\nLoading workout data...")
-    df, category_df = load_workout_data()
+    df = load_workout_data()
+
+    # Row positions of each exercise, partitioned once and gathered with
+    # take() by the generators that work per exercise
+    exercise_rows = df.groupby('exercise_title', sort=False, observed=True).indices
+
     print(f"  Loaded {len(df)} workout records")
-    print(f"  Unique exercises: {df['exercise_title'].nunique()}")
-    print(f"  Date range: {df['date'].min()} to {df['date'].max()}")
-
-    # Generate JSON files
-    print("\nGenerating simple JSON files...")
-    generate_summary(df, category_df)
-    generate_time_analysis(df)
-    generate_big_three_analysis(df)
-    generate_exercise_frequency(df)
-    generate_exercise_volume(df)
-    generate_weight_distribution(df)
-    generate_reps_distribution(df)
-    generate_category_analysis(category_df)
-    generate_workout_balance(category_df)
-    generate_workout_dates(df)
-    generate_personal_records(df)
-    generate_goal_setting(df)
-
-    print("\nGenerating complex JSON files...")
-    generate_monthly_summary(df)
-    generate_category_exercises(category_df)
-    generate_exercise_details(df)
-    generate_recent_workouts(df)
+    print(f"  Unique exercises: {len(exercise_rows)}")
+    print(f"  Date range: {df['start_time'].min().date()} to {df['start_time'].max().date()}")
+
+    # Aggregates shared by several generators, grouped once
+    exercise_volume = df.groupby('exercise_title', observed=True)['volume'].sum()
+    exercise_counts = df['exercise_title'].value_counts()
+    category_counts = df['category'].value_counts()
+    category_stats = df.groupby('category', observed=True).agg(
+        volume=('volume', 'sum'),
+        weight_lbs=('weight_lbs', 'mean'),
+        reps=('reps', 'mean')
+    )
+
+    # Generate JSON files. The generators are CPU-bound and each writes its
+    # own file, so spread them over worker processes. The frame is handed to
+    # each worker once through the initializer instead of with every task
+    print("\nGenerating JSON files...")
+    with ProcessPoolExecutor(initializer=init_worker, initargs=(df,)) as executor:
+        futures = [
+            executor.submit(run_with_df, generate_summary, exercise_volume, category_counts, category_stats),
+            executor.submit(run_with_df, generate_time_analysis),
+            executor.submit(run_with_df, generate_big_three_analysis),
+            executor.submit(generate_exercise_frequency, exercise_counts),
+            executor.submit(generate_exercise_volume, exercise_volume),
+            executor.submit(run_with_df, generate_weight_distribution),
+            executor.submit(run_with_df, generate_reps_distribution),
+            executor.submit(generate_category_analysis, category_counts, category_stats),
+            executor.submit(generate_workout_balance, category_stats),
+            executor.submit(run_with_df, generate_workout_dates),
+            executor.submit(run_with_df, generate_personal_records, exercise_rows),
+            executor.submit(run_with_df, generate_goal_setting, exercise_rows),
+            executor.submit(run_with_df, generate_monthly_summary),
+            executor.submit(run_with_df, generate_category_exercises),
+            executor.submit(run_with_df, generate_exercise_details, exercise_rows),
+            executor.submit(run_with_df, generate_recent_workouts),
+        ]
+        # Re-raise the first failure, if any
+        for future in futures:
+            future.result()
 
     # Copy assets
     copy_assets()
@@ -6,51 +6,126 @@ This script will:
 2. Run the category analysis (analyze_categories.py)
 3. Generate the HTML report (generate_report.py)
 4. Start the web dashboard (app.py)
+
+Steps 1-3 share a single load of the CSV. Steps 1 and 2 are independent and
+run in parallel worker processes; step 3 runs here once both have finished.
+The web dashboard is started as a separate process.
 """
 
 import os
+import io
 import sys
 import subprocess
-import time
+import socket
 import shutil
+from contextlib import redirect_stdout, redirect_stderr
+from concurrent.futures import ProcessPoolExecutor, wait
 from datetime import datetime
+from functools import lru_cache
+
+import analyze_workout
+import analyze_categories
+import generate_report
+
+# Workout export shared by the analysis steps
+DATA_FILE = 'data/June 16, 2025.csv'
+
+# Rule printed above and below each header
+HEADER_RULE = "=" * 80
+
+# Ports tried for the local web dashboard, in order
+DASHBOARD_PORTS = [8000, 5000]
+
+# Plot directories mirrored into static/images for the web dashboard
+PLOT_DIRS = ['plots', 'category_plots', 'progress_plots']
+
+@lru_cache(maxsize=32)
+def format_header(message):
+    """Render a header message as a banner between two rules."""
+    return f"\n{HEADER_RULE}\n{f' {message} '.center(80, '=')}\n{HEADER_RULE}\n\n"
 
 def print_header(message):
     """Print a formatted header message."""
-    print("\n" + "=" * 80)
-    print(f" {message} ".center(80, "="))
-    print("=" * 80 + "\n")
+    sys.stdout.write(format_header(message))
 
-def run_command(command, description):
-    """Run a shell command and print its output."""
+def run_step(description, step, *args):
+    """Run an analysis step in this process and print its outcome."""
     print_header(description)
-    print(f"Running command: {command}")
     
     try:
-        process = subprocess.Popen(
-            command,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True
-        )
-        
-        # Print output in real-time
-        for line in process.stdout:
-            print(line, end='')
-        
-        process.wait()
-        
-        if process.returncode != 0:
-            print(f"\nCommand failed with exit code {process.returncode}")
+        step(*args)
+    except Exception as e:
+        print(f"\nError running step: {e}")
+        return False
+    
+    print(f"\nStep completed successfully.")
+    return True
+
+def port_available(port):
+    """Return True if the web dashboard can bind to port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        # Match the server's own bind so a port in TIME_WAIT still counts as free
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind(('0.0.0.0', port))
+        except OSError:
             return False
-        
-        print(f"\nCommand completed successfully.")
-        return True
+    return True
+
+def capture_step(step, *args):
+    """Run an analysis step with its output buffered.
     
+    Returns (succeeded, output) so concurrent steps can be reported one at a
+    time instead of interleaving their prints.
+    """
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer), redirect_stderr(buffer):
+            step(*args)
     except Exception as e:
-        print(f"\nError running command: {e}")
-        return False
+        return False, buffer.getvalue() + f"\nError running step: {e}\n"
+    return True, buffer.getvalue()
+
+def link_or_copy(src, dst):
+    """Hard link the os.DirEntry src to dst, falling back to a copy.
+    
+    Returns False without touching dst when it is already up to date.
+    """
+    src_stat = src.stat()
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        pass
+    else:
+        # Already linked: the plot scripts rewrite the shared inode in place
+        if (dst_stat.st_ino, dst_stat.st_dev) == (src_stat.st_ino, src_stat.st_dev):
+            return False
+        # copy2 carries the source's mtime over, so only a destination made
+        # from this exact version of the plot matches it
+        if (dst_stat.st_size, dst_stat.st_mtime_ns) == (src_stat.st_size, src_stat.st_mtime_ns):
+            return False
+        os.remove(dst)
+    
+    try:
+        # Metadata-only; the plot bytes are never read or rewritten
+        os.link(src.path, dst)
+    except OSError:
+        # Different filesystem or no hard link support
+        shutil.copy2(src.path, dst)
+    return True
+
+def mirror_plots(src_dir, dst_dir):
+    """Link every PNG in src_dir into dst_dir."""
+    if not os.path.exists(src_dir):
+        return
+    
+    # scandir hands back the stat results link_or_copy needs
+    with os.scandir(src_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.png'):
+                dst = os.path.join(dst_dir, entry.name)
+                if link_or_copy(entry, dst):
+                    print(f"Copied {entry.path} to {dst}")
 
 def copy_plots_to_static():
     """Copy all plot images to the static directory for the web dashboard."""
@@ -59,32 +134,8 @@ def copy_plots_to_static():
     # Create static/images directory if it doesn't exist
     os.makedirs('static/images', exist_ok=True)
     
-    # Copy plots from plots directory
-    if os.path.exists('plots'):
-        for filename in os.listdir('plots'):
-            if filename.endswith('.png'):
-                src = os.path.join('plots', filename)
-                dst = os.path.join('static/images', filename)
-                shutil.copy2(src, dst)
-                print(f"Copied {src} to {dst}")
-    
-    # Copy plots from category_plots directory
-    if os.path.exists('category_plots'):
-        for filename in os.listdir('category_plots'):
-            if filename.endswith('.png'):
-                src = os.path.join('category_plots', filename)
-                dst = os.path.join('static/images', filename)
-                shutil.copy2(src, dst)
-                print(f"Copied {src} to {dst}")
-    
-    # Copy plots from progress_plots directory
-    if os.path.exists('progress_plots'):
-        for filename in os.listdir('progress_plots'):
-            if filename.endswith('.png'):
-                src = os.path.join('progress_plots', filename)
-                dst = os.path.join('static/images', filename)
-                shutil.copy2(src, dst)
-                print(f"Copied {src} to {dst}")
+    for plot_dir in PLOT_DIRS:
+        mirror_plots(plot_dir, 'static/images')
     
     print("\nAll plots copied to static/images directory.")
 
@@ -93,18 +144,32 @@ def main():
     start_time = datetime.now()
     print_header(f"Starting unified dashboard at {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Run basic analysis
-    if not run_command("python analyze_workout.py", "Running Basic Analysis"):
-        print("Basic analysis failed. Exiting.")
-        return
+    # Parse the CSV once. Each step mutates its frame: the analysis workers
+    # receive pickled copies, and the report, the last step, takes the original
+    raw_df = analyze_workout.load_data(DATA_FILE)
     
-    # Run category analysis
-    if not run_command("python analyze_categories.py", "Running Category Analysis"):
-        print("Category analysis failed. Exiting.")
-        return
+    # The basic and category analyses only read the data, so they run side by
+    # side. pyplot is not thread-safe, hence processes rather than threads
+    analyses = [
+        ("Running Basic Analysis", "Basic analysis", analyze_workout.run_analysis),
+        ("Running Category Analysis", "Category analysis", analyze_categories.run_analysis),
+    ]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(capture_step, step, raw_df) for _, _, step in analyses]
+        wait(futures)
+    
+    # Report each analysis in order once both have finished
+    for (description, name, _), future in zip(analyses, futures):
+        print_header(description)
+        succeeded, output = future.result()
+        print(output, end='')
+        if not succeeded:
+            print(f"{name} failed. Exiting.")
+            return
+        print(f"\nStep completed successfully.")
     
     # Generate HTML report
-    if not run_command("python generate_report.py", "Generating HTML Report"):
+    if not run_step("Generating HTML Report", generate_report.generate_report, raw_df):
         print("HTML report generation failed. Exiting.")
         return
     
@@ -112,82 +177,36 @@ def main():
     elapsed_time = datetime.now() - start_time
     print_header(f"Analysis completed in {elapsed_time.total_seconds():.2f} seconds")
     
+    # A PORT set in the environment (e.g. by Render) is used as is. Otherwise
+    # check the port before launching rather than parsing the server's logs
+    # for a bind failure: app.py's default 8000 first, then 5000
+    if os.environ.get('PORT'):
+        port = int(os.environ['PORT'])
+    else:
+        port = DASHBOARD_PORTS[0]
+        if not port_available(port):
+            print(f"Port {port} is in use. Using port {DASHBOARD_PORTS[1]} instead.")
+            port = DASHBOARD_PORTS[1]
+    
     # Start the web dashboard
     print_header("Starting Web Dashboard")
-    print("Access the dashboard at http://localhost:5000")
+    print(f"Access the dashboard at http://localhost:{port}")
     print("Press Ctrl+C to stop the server")
     
     # Run the Flask app
     try:
-        # Try to use port 5000 first
-        port = 5000
-        command = f"python app.py"
+        # Run app.py with this interpreter: no shell and no PATH lookup.
+        # app.py reads its port from the PORT environment variable
+        command = [sys.executable, "app.py"]
         
-        # Start the Flask app
+        # close_fds=False lets subprocess use posix_spawn instead of fork+exec;
+        # Python's own descriptors are non-inheritable, so nothing leaks
+        sys.stdout.flush()
         process = subprocess.Popen(
             command,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True
+            env={**os.environ, 'PORT': str(port)},
+            close_fds=False
         )
-        
-        # Print output in real-time
-        for line in process.stdout:
-            print(line, end='')
-            
-            # If port 5000 is in use, try port 8000
-            if "Address already in use" in line and "Port 5000 is in use" in line:
-                print("\nPort 5000 is in use. Trying port 8000...")
-                process.terminate()
-                time.sleep(1)
-                
-                # Modify app.py to use port 8000
-                with open('app.py', 'r') as file:
-                    content = file.read()
-                
-                # Replace the app.run line
-                if "app.run(debug=True)" in content:
-                    new_content = content.replace(
-                        "app.run(debug=True)", 
-                        "app.run(host='0.0.0.0', port=8000, debug=True)"
-                    )
-                    
-                    with open('app.py', 'w') as file:
-                        file.write(new_content)
-                    
-                    print("Updated app.py to use port 8000")
-                    
-                    # Check if we're in production environment (Render)
-                    # Render sets RENDER=true for all services on their platform
-                    is_production = os.environ.get('RENDER') == 'true'
-                    if is_production:
-                        # Use gunicorn in production
-                        port = os.environ.get('PORT', '10000')
-                        command = f"gunicorn app:app --bind=0.0.0.0:{port}"
-                        print(f"Starting server in PRODUCTION mode on port {port}")
-                    else:
-                        # Use Flask development server locally
-                        # Make sure we explicitly set host and port for Flask too
-                        port = os.environ.get('PORT', '10000')
-                        command = f"python app.py"
-                        # Ensure PORT environment variable is accessible to the Flask app
-                        os.environ['PORT'] = port
-                    
-                    process = subprocess.Popen(
-                        command,
-                        shell=True,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        universal_newlines=True
-                    )
-                    
-                    # Print output in real-time
-                    for line in process.stdout:
-                        print(line, end='')
-                    
-                    break
-        
         process.wait()
     
     except KeyboardInterrupt: